@@ -5,19 +5,62 @@ A Model Context Protocol (MCP) server for auditing smart contracts using Slither
 """
 
 import asyncio
+import functools
+import hashlib
+import io
 import json
+import os
 import re
 import shutil
-import subprocess
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+try:  # Optional: SIMD-accelerated multi-pattern DFA for literal scans
+    import hyperscan
+except ImportError:  # pragma: no cover - exercised via the fallback path
+    hyperscan = None
+
+try:  # Optional: faster JSON parse/serialize for large tool reports
+    import orjson
+except ImportError:  # pragma: no cover - exercised via the fallback path
+    orjson = None
+
+try:  # Optional: linear-time regex engine (no NFA backtracking)
+    import re2 as _re_impl
+except ImportError:  # pragma: no cover - exercised via the fallback path
+    _re_impl = re
+
+try:  # Optional: incremental parsing of large Slither reports
+    import ijson
+except ImportError:  # pragma: no cover - exercised via the fallback path
+    ijson = None
+
+try:  # POSIX-only; caps resource usage of audit subprocesses
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
+
+
+if orjson is not None:
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    def _json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 
 TOOL_INSTALL_INSTRUCTIONS: Dict[str, str] = {
     "slither": "pip install slither-analyzer",
@@ -31,32 +74,291 @@ TOOL_VERSION_COMMANDS: Dict[str, List[List[str]]] = {
 }
 
 
-@dataclass
+# (tool name, binary on PATH) pairs probed by check_tools.
+_TOOL_BINARIES = (
+    ("slither", "slither"),
+    ("aderyn", "aderyn"),
+)
+
+
+# Stream buffer limit for audit subprocesses; Slither reports can run to
+# tens of MB and the default 64 KiB limit would stall the child on write.
+_SUBPROCESS_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+# Per-subprocess caps: 4 GiB of address space and 600s of CPU, so one
+# pathological analysis cannot wedge the host under concurrent load.
+_SUBPROCESS_MEMORY_LIMIT = 4 << 30
+_SUBPROCESS_CPU_LIMIT = 600
+
+
+def _limit_subprocess_resources() -> None:  # pragma: no cover - runs in the child
+    """Apply resource caps in the forked child before exec (POSIX only)."""
+    resource.setrlimit(
+        resource.RLIMIT_AS, (_SUBPROCESS_MEMORY_LIMIT, _SUBPROCESS_MEMORY_LIMIT)
+    )
+    resource.setrlimit(
+        resource.RLIMIT_CPU, (_SUBPROCESS_CPU_LIMIT, _SUBPROCESS_CPU_LIMIT)
+    )
+
+
+_SUBPROCESS_PREEXEC = _limit_subprocess_resources if resource is not None else None
+
+
+# First Solidity version with built-in overflow checks.
+_MIN_SAFE_SOLIDITY = (0, 8)
+
+
+# On-disk cache of successful tool runs, keyed by contract content hash.
+# External analyzers are deterministic for a given (tool version, content,
+# arguments), so re-auditing an unchanged contract becomes a file read.
+_AUDIT_CACHE_DIR = Path(
+    os.environ.get("MCP_SCAUDIT_CACHE", "~/.cache/mcp-scaudit")
+).expanduser()
+
+# Cap on the on-disk cache; oldest entries are evicted past this point so
+# large tool reports cannot grow the directory without bound.
+_AUDIT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+# Pattern-analysis regexes, compiled once at import time. They operate on
+# raw bytes so pattern analysis never has to UTF-8 decode the whole file,
+# and use google-re2's linear-time engine when it is installed.
+_PRAGMA_RE = _re_impl.compile(rb"pragma solidity\s+\^?([\d.]+)")
+_ARITH_RE = _re_impl.compile(rb"[+\-*/]")
+_CALL_VALUE_RE = _re_impl.compile(rb"\.call\{value:")
+
+# Comments and string literals, blanked out before scanning so that e.g.
+# `// uses selfdestruct` or a quoted keyword cannot trigger a finding. The
+# stripped buffer is also smaller, which speeds every downstream scan.
+# DOTALL is spelled inline as (?s) because the re2 module exposes no flag
+# constants.
+_COMMENT_RE = _re_impl.compile(rb'(?s)//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\])*"')
+
+
+# Literal anti-patterns reported by analyze_contract_patterns, in report order.
+_LITERAL_FINDINGS: Dict[bytes, str] = {
+    b"selfdestruct": "WARNING: Contract contains selfdestruct - potential security risk",
+    b"delegatecall": "WARNING: Contract uses delegatecall - ensure proper access control",
+    b"tx.origin": "WARNING: Contract uses tx.origin - vulnerable to phishing attacks",
+    b"block.timestamp": "INFO: Contract uses block.timestamp - be aware of miner manipulation",
+}
+
+
+# Single alternation over all literal keywords: one walk over the buffer
+# instead of one memmem scan per keyword when the automaton is unavailable.
+_LITERAL_ALT_RE = _re_impl.compile(b"|".join(re.escape(k) for k in _LITERAL_FINDINGS))
+
+
+# Leading bytes of the literal keywords; content containing none of them
+# cannot match any keyword, so the scan is skipped outright.
+_LITERAL_FIRST_BYTES = frozenset(keyword[0] for keyword in _LITERAL_FINDINGS)
+
+
+# Keyword order fixed so Hyperscan match ids can index back into it.
+_LITERAL_KEYWORDS = tuple(_LITERAL_FINDINGS)
+
+
+def _build_literal_hs_db():
+    """Compile the literal anti-patterns into a Hyperscan database."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[re.escape(keyword) for keyword in _LITERAL_KEYWORDS],
+            ids=list(range(len(_LITERAL_KEYWORDS))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_LITERAL_KEYWORDS),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+_LITERAL_HS_DB = _build_literal_hs_db()
+
+
+def _scan_literal_patterns(content: bytes) -> List[str]:
+    """Find literal anti-patterns in a single pass over the content."""
+    if not content:
+        return []
+    # memchr-backed screen: each check exits at the first occurrence, so the
+    # common case (byte present early) costs almost nothing.
+    if not any(first in content for first in _LITERAL_FIRST_BYTES):
+        return []
+    if _LITERAL_HS_DB is not None:
+        matched_ids: set = set()
+        # Scans run on asyncio.to_thread workers, so each needs its own
+        # scratch; sharing the database's implicit one races across threads.
+        _LITERAL_HS_DB.scan(
+            content,
+            match_event_handler=lambda pid, start, end, flags, ctx: matched_ids.add(pid),
+            scratch=hyperscan.Scratch(_LITERAL_HS_DB),
+        )
+        hits = {_LITERAL_KEYWORDS[pid] for pid in matched_ids}
+    else:
+        hits = {match.group(0) for match in _LITERAL_ALT_RE.finditer(content)}
+    return [finding for keyword, finding in _LITERAL_FINDINGS.items() if keyword in hits]
+
+
+@dataclass(slots=True)
 class AuditResult:
-    """Result of an audit operation."""
+    """Result of an audit operation.
+
+    ``output`` may hold raw subprocess bytes; they are decoded once at the
+    MCP serialization boundary instead of per producer.
+    """
 
     success: bool
-    output: Optional[str] = None
+    output: Optional[Union[str, bytes]] = None
     error: Optional[str] = None
     findings: List[Any] = field(default_factory=list)
 
 
+def _as_text(payload: Optional[Union[str, bytes]]) -> Optional[str]:
+    """Decode an AuditResult payload to text at the response boundary."""
+    if isinstance(payload, bytes):
+        return payload.decode("utf-8", errors="replace")
+    return payload
+
+
+def _audit_cache_key(tool: str, content: bytes, args: tuple) -> str:
+    """Derive a cache key from the tool, contract content, and arguments."""
+    hasher = hashlib.blake2b(content)
+    hasher.update(f"|{tool}|{args!r}".encode())
+    return hasher.hexdigest()
+
+
+def _audit_cache_get(key: str) -> Optional[AuditResult]:
+    """Return a previously cached successful result, or None."""
+    try:
+        raw = (_AUDIT_CACHE_DIR / f"{key}.json").read_bytes()
+        payload = _json_loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        # Corrupted entry; treat it as a miss and let the normal run rewrite it.
+        return None
+    return AuditResult(
+        success=True,
+        output=payload.get("output"),
+        findings=payload.get("findings", []),
+    )
+
+
+def _audit_cache_put(key: str, result: AuditResult) -> None:
+    """Persist a successful result; caching is best-effort."""
+    try:
+        _AUDIT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = {"output": _as_text(result.output), "findings": result.findings}
+        (_AUDIT_CACHE_DIR / f"{key}.json").write_text(_json_dumps(payload))
+        _prune_audit_cache()
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _prune_audit_cache() -> None:
+    """Evict the oldest cached reports once the cache exceeds its size cap."""
+    entries = []
+    for path in _AUDIT_CACHE_DIR.glob("*.json"):
+        try:
+            entries.append((path.stat(), path))
+        except OSError:
+            continue
+    total = sum(stat.st_size for stat, _ in entries)
+    if total <= _AUDIT_CACHE_MAX_BYTES:
+        return
+    for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= stat.st_size
+        if total <= _AUDIT_CACHE_MAX_BYTES:
+            return
+
+
+@functools.lru_cache(maxsize=32)
 def command_exists(command: str) -> bool:
-    """Check if a command exists in the system."""
+    """Check if a command exists in the system.
+
+    Cached for the process lifetime since tools rarely appear mid-session;
+    call ``command_exists.cache_clear()`` after installing a tool.
+    """
     return shutil.which(command) is not None
 
 
+# Availability of external binaries, probed once at server startup so the
+# per-request handlers never walk PATH.
+TOOLS_AVAILABLE: Dict[str, bool] = {}
+
+
+def _tool_available(binary: str) -> bool:
+    """Check binary availability via the startup probe, else a PATH lookup."""
+    cached = TOOLS_AVAILABLE.get(binary)
+    if cached is not None:
+        return cached
+    return command_exists(binary)
+
+
 def file_exists(path: Optional[str]) -> bool:
     """Check if a file exists."""
     if not path:
         return False
-    return Path(path).is_file()
+    return os.path.isfile(path)
+
+
+async def _run_tool_command(args: List[str], timeout: float) -> tuple:
+    """Run an external tool, returning (returncode, stdout, stderr) as bytes.
+
+    On timeout the child is killed and reaped before asyncio.TimeoutError
+    propagates to the caller.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_SUBPROCESS_STREAM_LIMIT,
+        preexec_fn=_SUBPROCESS_PREEXEC,
+    )
+    try:
+        stdout_b, stderr_b = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout_b, stderr_b
 
 
-async def run_slither(contract_path: Optional[str], 
+def _extract_slither_findings(report: bytes) -> List[Any]:
+    """Pull results.detectors out of a Slither JSON report.
+
+    With ijson installed only the detector items are materialized instead
+    of the whole document tree; otherwise the raw bytes are parsed in one
+    go. An unparsable report yields no findings (raw output still returned).
+    """
+    if ijson is not None:
+        try:
+            return list(ijson.items(io.BytesIO(report), "results.detectors.item"))
+        except ijson.JSONError:
+            return []
+    try:
+        json_output = _json_loads(report)
+        return json_output.get("results", {}).get("detectors", [])
+    except ValueError:
+        return []
+
+
+async def run_slither(contract_path: Optional[str],
                       detectors: Optional[str] = None,
-                      exclude_detectors: Optional[str] = None) -> AuditResult:
-    """Run Slither analysis on a smart contract."""
+                      exclude_detectors: Optional[str] = None,
+                      parse_findings: bool = True) -> AuditResult:
+    """Run Slither analysis on a smart contract.
+
+    ``parse_findings=False`` skips extracting the detector list from the
+    report; callers that only forward the raw JSON (the MCP text response)
+    avoid parsing a multi-MB document nobody reads.
+    """
     try:
         if not contract_path:
             return AuditResult(
@@ -70,7 +372,7 @@ async def run_slither(contract_path: Optional[str],
                 error=f"Contract file not found: {contract_path}"
             )
         
-        if not command_exists("slither"):
+        if not _tool_available("slither"):
             return AuditResult(
                 success=False,
                 error="Slither is not installed. Please install it with: pip install slither-analyzer"
@@ -81,37 +383,40 @@ async def run_slither(contract_path: Optional[str],
             args.extend(["--detect", detectors])
         if exclude_detectors:
             args.extend(["--exclude", exclude_detectors])
-        
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=300
+
+        version = await _get_tool_version("slither", TOOL_VERSION_COMMANDS["slither"])
+        cache_key = _audit_cache_key(
+            "slither",
+            await asyncio.to_thread(_resolve_contract, contract_path),
+            (detectors, exclude_detectors, version, parse_findings),
         )
+        cached = await asyncio.to_thread(_audit_cache_get, cache_key)
+        if cached is not None:
+            return cached
 
-        if result.returncode != 0:
-            error_output = result.stderr.strip() or result.stdout.strip()
-            message = error_output or f"Slither exited with code {result.returncode}"
-            return AuditResult(success=False, error=f"Slither analysis failed: {message}")
-        
-        findings = []
         try:
-            json_output = json.loads(result.stdout)
-            findings = json_output.get("results", {}).get("detectors", [])
-        except json.JSONDecodeError:
-            # If JSON parsing fails, return raw output
-            pass
-        
-        return AuditResult(
+            returncode, stdout_b, stderr_b = await _run_tool_command(args, timeout=300)
+        except asyncio.TimeoutError:
+            return AuditResult(
+                success=False,
+                error="Slither analysis timed out"
+            )
+        if returncode != 0:
+            stdout = stdout_b.decode("utf-8", errors="replace")
+            stderr = stderr_b.decode("utf-8", errors="replace")
+            error_output = stderr.strip() or stdout.strip()
+            message = error_output or f"Slither exited with code {returncode}"
+            return AuditResult(success=False, error=f"Slither analysis failed: {message}")
+
+        findings = _extract_slither_findings(stdout_b) if parse_findings else []
+
+        result = AuditResult(
             success=True,
-            output=result.stdout,
+            output=stdout_b,
             findings=findings
         )
-    except subprocess.TimeoutExpired:
-        return AuditResult(
-            success=False,
-            error="Slither analysis timed out"
-        )
+        await asyncio.to_thread(_audit_cache_put, cache_key, result)
+        return result
     except Exception as e:
         return AuditResult(
             success=False,
@@ -128,7 +433,7 @@ async def run_aderyn(contract_path: Optional[str]) -> AuditResult:
                 error=f"Contract file not found: {contract_path}"
             )
         
-        if not command_exists("aderyn"):
+        if not _tool_available("aderyn"):
             return AuditResult(
                 success=False,
                 error=(
@@ -138,27 +443,36 @@ async def run_aderyn(contract_path: Optional[str]) -> AuditResult:
                 ),
             )
         
-        result = subprocess.run(
-            ["aderyn", contract_path],
-            capture_output=True,
-            text=True,
-            timeout=300
+        version = await _get_tool_version("aderyn", TOOL_VERSION_COMMANDS["aderyn"])
+        cache_key = _audit_cache_key(
+            "aderyn", await asyncio.to_thread(_resolve_contract, contract_path), (version,)
         )
+        cached = await asyncio.to_thread(_audit_cache_get, cache_key)
+        if cached is not None:
+            return cached
 
-        if result.returncode != 0:
-            error_output = result.stderr.strip() or result.stdout.strip()
-            message = error_output or f"Aderyn exited with code {result.returncode}"
+        try:
+            returncode, stdout_b, stderr_b = await _run_tool_command(
+                ["aderyn", contract_path], timeout=300
+            )
+        except asyncio.TimeoutError:
+            return AuditResult(
+                success=False,
+                error="Aderyn analysis timed out"
+            )
+        if returncode != 0:
+            stdout = stdout_b.decode("utf-8", errors="replace")
+            stderr = stderr_b.decode("utf-8", errors="replace")
+            error_output = stderr.strip() or stdout.strip()
+            message = error_output or f"Aderyn exited with code {returncode}"
             return AuditResult(success=False, error=f"Aderyn analysis failed: {message}")
-        
-        return AuditResult(
+
+        result = AuditResult(
             success=True,
-            output=result.stdout
-        )
-    except subprocess.TimeoutExpired:
-        return AuditResult(
-            success=False,
-            error="Aderyn analysis timed out"
+            output=stdout_b
         )
+        await asyncio.to_thread(_audit_cache_put, cache_key, result)
+        return result
     except Exception as e:
         return AuditResult(
             success=False,
@@ -166,71 +480,153 @@ async def run_aderyn(contract_path: Optional[str]) -> AuditResult:
         )
 
 
-async def analyze_contract_patterns(contract_path: Optional[str]) -> AuditResult:
-    """Read and analyze a contract file for basic patterns"""
+@functools.lru_cache(maxsize=128)
+def _load_contract(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a contract file as raw bytes, cached by (path, mtime, size).
+
+    Unchanged files are read from disk only once per session; the stat-based
+    key ensures edits on disk invalidate the cached content. Returning bytes
+    lets pattern analysis scan without decoding; read_contract decodes once.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# OSErrors that mean "no usable file at this path", matching what the old
+# Path.is_file() guard treated as missing.
+_MISSING_FILE_ERRORS = (FileNotFoundError, IsADirectoryError, NotADirectoryError)
+
+
+def _resolve_contract(contract_path: Optional[str]) -> bytes:
+    """Resolve and read a contract with a single stat.
+
+    Raises one of _MISSING_FILE_ERRORS when the path does not name a
+    readable regular file; callers map that to their usual error result.
+    """
+    if not contract_path:
+        raise FileNotFoundError(contract_path)
+    st = os.stat(contract_path)
+    return _load_contract(contract_path, st.st_mtime_ns, st.st_size)
+
+
+def _parse_solidity_version(content: bytes) -> Optional[tuple]:
+    """Parse (major, minor) from the solidity pragma without the regex.
+
+    Byte-level fast path for the common ``pragma solidity ^X.Y.Z`` form;
+    anything it cannot parse falls back to the compiled regex.
+    """
+    # The pragma sits at the top of a source file; bound the fast search so
+    # huge inputs do not pay a full scan here. Files whose pragma appears
+    # later (e.g. behind an unusually long header) hit the regex fallback.
+    idx = content.find(b"pragma solidity", 0, 8192)
+    if idx == -1:
+        return _parse_solidity_version_regex(content) if len(content) > 8192 else None
+
+    pos = idx + len(b"pragma solidity")
+    n = len(content)
+    ws_start = pos
+    while pos < n and content[pos] in b" \t\r\n":
+        pos += 1
+    if pos == ws_start:
+        return _parse_solidity_version_regex(content)
+    if content[pos:pos + 1] == b"^":
+        pos += 1
+
+    start = pos
+    while pos < n and 0x30 <= content[pos] <= 0x39:
+        pos += 1
+    if pos == start or content[pos:pos + 1] != b".":
+        return _parse_solidity_version_regex(content)
+    major = int(content[start:pos])
+
+    pos += 1
+    start = pos
+    while pos < n and 0x30 <= content[pos] <= 0x39:
+        pos += 1
+    if pos == start:
+        return _parse_solidity_version_regex(content)
+    minor = int(content[start:pos])
+
+    return (major, minor)
+
+
+def _parse_solidity_version_regex(content: bytes) -> Optional[tuple]:
+    """Regex fallback for pragma forms the fast scanner does not handle."""
+    version_match = _PRAGMA_RE.search(content)
+    if not version_match:
+        return None
+    version_str = version_match.group(1).decode("ascii", errors="replace")
     try:
-        if not file_exists(contract_path):
+        parts = version_str.split('.', 2)
+        return (int(parts[0]), int(parts[1]))
+    except (ValueError, IndexError):
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_contract_patterns(path: str, mtime_ns: int, size: int) -> tuple:
+    """Run the pattern checks for a contract, cached by (path, mtime, size)."""
+    return _scan_patterns(_load_contract(path, mtime_ns, size))
+
+
+def _scan_patterns(content: bytes) -> tuple:
+    """Run all pattern checks over contract content."""
+    # Blank out comments and string literals so only real code can match.
+    content = _COMMENT_RE.sub(b" ", content)
+
+    # Literal anti-patterns: one automaton pass instead of a scan per keyword
+    findings = _scan_literal_patterns(content)
+
+    # Check for Solidity version; the cheap substring test skips the
+    # parse entirely on files without a pragma.
+    version = _parse_solidity_version(content) if b"pragma" in content else None
+    is_solidity_08_plus = version is not None and version >= _MIN_SAFE_SOLIDITY
+
+    if b"SafeMath" not in content and not is_solidity_08_plus and _ARITH_RE.search(content):
+        findings.append(
+            "WARNING: Consider using SafeMath library or upgrading to Solidity 0.8+ for arithmetic overflow protection"
+        )
+
+    if b".call" in content and _CALL_VALUE_RE.search(content):
+        findings.append(
+            "WARNING: Potential reentrancy risk - ensure checks-effects-interactions pattern"
+        )
+
+    return tuple(findings)
+
+
+async def analyze_contract_patterns(contract_path: Optional[str],
+                                    content: Optional[bytes] = None) -> AuditResult:
+    """Read and analyze a contract file for basic patterns.
+
+    ``content`` lets callers that already read the file (e.g. audit_all)
+    reuse the buffer instead of re-statting and re-reading it.
+    """
+    try:
+        try:
+            if content is not None:
+                findings = list(await asyncio.to_thread(_scan_patterns, content))
+            else:
+                if not contract_path:
+                    raise FileNotFoundError(contract_path)
+                st = os.stat(contract_path)
+                findings = list(
+                    await asyncio.to_thread(
+                        _scan_contract_patterns, contract_path, st.st_mtime_ns, st.st_size
+                    )
+                )
+        except _MISSING_FILE_ERRORS:
             return AuditResult(
                 success=False,
                 error=f"Contract file not found: {contract_path}"
             )
-        
-        with open(contract_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        findings = []
-        
-        # Basic pattern checks
-        if "selfdestruct" in content:
-            findings.append(
-                "WARNING: Contract contains selfdestruct - potential security risk"
-            )
-        
-        if "delegatecall" in content:
-            findings.append(
-                "WARNING: Contract uses delegatecall - ensure proper access control"
-            )
-        
-        if "tx.origin" in content:
-            findings.append(
-                "WARNING: Contract uses tx.origin - vulnerable to phishing attacks"
-            )
-        
-        # Check for Solidity version
-        version_match = re.search(r'pragma solidity\s+[\^]?([\d.]+)', content)
-        is_solidity_08_plus = False
-        if version_match:
-            version_str = version_match.group(1)
-            try:
-                major, minor = version_str.split('.')[:2]
-                is_solidity_08_plus = int(major) == 0 and int(minor) >= 8
-            except (ValueError, IndexError):
-                pass
-        
-        if "SafeMath" not in content and re.search(r'[\+\-\*\/]', content) and not is_solidity_08_plus:
-            findings.append(
-                "WARNING: Consider using SafeMath library or upgrading to Solidity 0.8+ for arithmetic overflow protection"
-            )
-        
-        if "block.timestamp" in content:
-            findings.append(
-                "INFO: Contract uses block.timestamp - be aware of miner manipulation"
-            )
-        
-        if re.search(r'\.call\{value:', content):
-            findings.append(
-                "WARNING: Potential reentrancy risk - ensure checks-effects-interactions pattern"
-            )
-        
+
         if findings:
-            output_lines = [
-                "Pattern Analysis Results:",
-                "",
-                *findings,
-                "",
-                f"Total: {len(findings)} potential issues found",
-            ]
-            output_msg = "\n".join(output_lines)
+            output_msg = (
+                "Pattern Analysis Results:\n\n"
+                + "\n".join(findings)
+                + f"\n\nTotal: {len(findings)} potential issues found"
+            )
         else:
             output_msg = "No security issues found in pattern analysis"
         
@@ -249,18 +645,17 @@ async def analyze_contract_patterns(contract_path: Optional[str]) -> AuditResult
 async def read_contract(contract_path: Optional[str]) -> AuditResult:
     """Read contract source code."""
     try:
-        if not file_exists(contract_path):
+        try:
+            content = await asyncio.to_thread(_resolve_contract, contract_path)
+        except _MISSING_FILE_ERRORS:
             return AuditResult(
                 success=False,
                 error=f"Contract file not found: {contract_path}"
             )
-        
-        with open(contract_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
+
         return AuditResult(
             success=True,
-            output=content
+            output=content.decode('utf-8')
         )
     except Exception as e:
         return AuditResult(
@@ -269,46 +664,136 @@ async def read_contract(contract_path: Optional[str]) -> AuditResult:
         )
 
 
-def _get_tool_version(commands: List[List[str]]) -> Optional[str]:
+async def run_all_audits(contract_path: Optional[str]) -> AuditResult:
+    """Run every audit concurrently on a contract and merge the results."""
+    try:
+        content = await asyncio.to_thread(_resolve_contract, contract_path)
+    except _MISSING_FILE_ERRORS:
+        return AuditResult(
+            success=False,
+            error=f"Contract file not found: {contract_path}"
+        )
+
+    audits = (
+        ("slither", run_slither(contract_path)),
+        ("aderyn", run_aderyn(contract_path)),
+        ("pattern_analysis", analyze_contract_patterns(contract_path, content=content)),
+    )
+    results = await asyncio.gather(*(coro for _, coro in audits), return_exceptions=True)
+
+    findings: List[Any] = []
+    sections = []
+    for (tool, _), result in zip(audits, results):
+        if isinstance(result, BaseException):
+            sections.append(f"=== {tool} ===\nERROR: {result}")
+        elif result.success:
+            sections.append(f"=== {tool} ===\n{_as_text(result.output) or ''}")
+            findings.extend(result.findings)
+        else:
+            sections.append(f"=== {tool} ===\nERROR: {result.error}")
+
+    return AuditResult(
+        success=True,
+        output="\n\n".join(sections),
+        findings=findings,
+    )
+
+
+# Probed versions cached per tool as (monotonic timestamp, version); tool
+# installations rarely change mid-session, so re-spawning the probe
+# subprocess on every check_tools call is wasted work.
+_VERSION_CACHE: Dict[str, tuple] = {}
+_VERSION_CACHE_TTL = 300.0
+
+
+async def _get_tool_version(tool: str, commands: List[List[str]]) -> Optional[str]:
+    """Retrieve a tool version, caching results for a short TTL."""
+    cached = _VERSION_CACHE.get(tool)
+    if cached is not None and time.monotonic() - cached[0] < _VERSION_CACHE_TTL:
+        return cached[1]
+
+    version = await _probe_tool_version(commands)
+    _VERSION_CACHE[tool] = (time.monotonic(), version)
+    return version
+
+
+async def _probe_tool_version(commands: List[List[str]]) -> Optional[str]:
     """Attempt to retrieve a tool version using the provided commands."""
     for command in commands:
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=30,
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-        except (FileNotFoundError, subprocess.SubprocessError):
+        except (FileNotFoundError, OSError):
+            continue
+
+        try:
+            stdout_b, stderr_b = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             continue
 
-        if result.returncode != 0:
+        if proc.returncode != 0:
             continue
 
-        candidate = (result.stdout or result.stderr or "").strip()
+        candidate = (stdout_b or stderr_b).decode("utf-8", errors="replace").strip()
         if candidate:
             return candidate.splitlines()[0]
 
     return None
 
 
-async def check_tools() -> AuditResult:
-    """Check availability of audit tools."""
-    tool_status: Dict[str, Dict[str, Optional[str]]] = {}
+# Rendered check_tools payload, cached as (timestamp, output, tool_status);
+# tool installations are stable within a session, so the JSON answer is
+# pre-baked and repeat calls skip the PATH walks and version probes.
+_CHECK_TOOLS_CACHE: Optional[tuple] = None
+
+
+async def check_tools(refresh: bool = False) -> AuditResult:
+    """Check availability of audit tools.
+
+    ``refresh=True`` drops all availability caches and re-probes, for use
+    after installing a tool mid-session.
+    """
+    global _CHECK_TOOLS_CACHE
 
-    for tool, binary in {
-        "slither": "slither",
-        "aderyn": "aderyn",
-    }.items():
-        installed = command_exists(binary)
-        version = None
-        if installed:
-            version = _get_tool_version(TOOL_VERSION_COMMANDS.get(tool, []))
+    if refresh:
+        command_exists.cache_clear()
+        _VERSION_CACHE.clear()
+        _CHECK_TOOLS_CACHE = None
 
-        tool_status[tool] = {
-            "installed": installed,
-            "version": version,
+    cached = _CHECK_TOOLS_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _VERSION_CACHE_TTL:
+        return AuditResult(success=True, output=cached[1], findings=[cached[2]])
+
+    installed: Dict[str, bool] = {}
+    for tool, binary in _TOOL_BINARIES:
+        present = command_exists(binary)
+        installed[tool] = present
+        # Keep the startup probe in sync so the audit handlers see tools
+        # installed (or removed) mid-session, not just this report.
+        TOOLS_AVAILABLE[binary] = present
+
+    probed = [tool for tool, present in installed.items() if present]
+    versions = dict(
+        zip(
+            probed,
+            await asyncio.gather(
+                *(_get_tool_version(tool, TOOL_VERSION_COMMANDS.get(tool, [])) for tool in probed)
+            ),
+        )
+    )
+
+    tool_status: Dict[str, Dict[str, Optional[str]]] = {
+        tool: {
+            "installed": present,
+            "version": versions.get(tool),
         }
+        for tool, present in installed.items()
+    }
 
     available = [name for name, status in tool_status.items() if status["installed"]]
     missing = [name for name in tool_status if name not in available]
@@ -320,9 +805,12 @@ async def check_tools() -> AuditResult:
         "installInstructions": TOOL_INSTALL_INSTRUCTIONS,
     }
 
+    output = _json_dumps(payload)
+    _CHECK_TOOLS_CACHE = (time.monotonic(), output, tool_status)
+
     return AuditResult(
         success=True,
-        output=json.dumps(payload, indent=2),
+        output=output,
         findings=[tool_status],
     )
 
@@ -409,6 +897,24 @@ def get_tool_definitions() -> List[Tool]:
                 "required": ["contract_path"],
             },
         ),
+        Tool(
+            name="audit_all",
+            description=(
+                "Run all available audits (Slither, Aderyn, and pattern analysis) on a smart "
+                "contract concurrently and return a merged report. Wall-clock time is roughly "
+                "that of the slowest tool rather than the sum."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "contract_path": {
+                        "type": "string",
+                        "description": "Path to the smart contract file",
+                    },
+                },
+                "required": ["contract_path"],
+            },
+        ),
         Tool(
             name="check_tools",
             description=(
@@ -417,47 +923,61 @@ def get_tool_definitions() -> List[Tool]:
             ),
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "refresh": {
+                        "type": "boolean",
+                        "description": (
+                            "Optional: Re-probe the system instead of answering from cache, "
+                            "e.g. after installing a tool"
+                        ),
+                    },
+                },
             },
         ),
     ]
 
 
-async def execute_tool(name: str, arguments: Dict[str, Any]) -> AuditResult:
-    """Dispatch execution to the correct tool handler."""
-
-    if name == "slither_audit":
-        contract_path = arguments.get("contract_path")
-        detectors = arguments.get("detectors")
-        exclude_detectors = arguments.get("exclude_detectors")
-        return await run_slither(contract_path, detectors, exclude_detectors)
+# Built once at import; the schemas never change during a process lifetime,
+# so list_tools can hand back the same objects on every request.
+_TOOL_DEFINITIONS = get_tool_definitions()
 
-    if name == "aderyn_audit":
-        contract_path = arguments.get("contract_path")
-        return await run_aderyn(contract_path)
 
-    if name == "pattern_analysis":
-        contract_path = arguments.get("contract_path")
-        return await analyze_contract_patterns(contract_path)
+# Tool-name to handler dispatch table: one dict lookup per call instead of a
+# chain of string comparisons. The slither handler forwards the raw report,
+# so it skips parsing findings nobody will read.
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[AuditResult]]] = {
+    "slither_audit": lambda a: run_slither(
+        a.get("contract_path"), a.get("detectors"), a.get("exclude_detectors"),
+        parse_findings=False,
+    ),
+    "aderyn_audit": lambda a: run_aderyn(a.get("contract_path")),
+    "pattern_analysis": lambda a: analyze_contract_patterns(a.get("contract_path")),
+    "read_contract": lambda a: read_contract(a.get("contract_path")),
+    "audit_all": lambda a: run_all_audits(a.get("contract_path")),
+    "check_tools": lambda a: check_tools(refresh=bool(a.get("refresh", False))),
+}
 
-    if name == "read_contract":
-        contract_path = arguments.get("contract_path")
-        return await read_contract(contract_path)
 
-    if name == "check_tools":
-        return await check_tools()
+async def execute_tool(name: str, arguments: Dict[str, Any]) -> AuditResult:
+    """Dispatch execution to the correct tool handler."""
 
-    return AuditResult(success=False, error=f"Unknown tool: {name}")
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return AuditResult(success=False, error=f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def main():
     """Main entry point for the MCP server"""
     server = Server("farofino-mcp")
-    tools = get_tool_definitions()
-    
+
+    # Probe the external binaries once so per-request handlers skip the
+    # PATH walk entirely.
+    TOOLS_AVAILABLE.update({binary: command_exists(binary) for _, binary in _TOOL_BINARIES})
+
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return tools
+        return _TOOL_DEFINITIONS
     
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -470,9 +990,9 @@ async def main():
                     text=result.error or "Unknown error occurred",
                 )]
 
-            payload = result.output
+            payload = _as_text(result.output)
             if payload is None and result.findings:
-                payload = json.dumps(result.findings, indent=2)
+                payload = _json_dumps(result.findings)
 
             return [TextContent(
                 type="text",
@@ -3,32 +3,74 @@
 from __future__ import annotations
 
 import json
-from types import SimpleNamespace
 
 import pytest
 
 from farofino_mcp import __main__ as server
 
 
+class FakeProcess:
+    """Minimal stand-in for an asyncio subprocess."""
+
+    def __init__(self, returncode=0, stdout=b"", stderr=b""):
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+
+    async def communicate(self):
+        return self._stdout, self._stderr
+
+    def kill(self):
+        self.returncode = -9
+
+    async def wait(self):
+        return self.returncode
+
+
 @pytest.mark.asyncio
 async def test_run_slither_success(monkeypatch, tmp_path):
     contract = tmp_path / "Test.sol"
     contract.write_text("pragma solidity ^0.8.0; contract Test {}")
 
     monkeypatch.setattr(server, "command_exists", lambda name: name == "slither")
+    monkeypatch.setattr(server, "_AUDIT_CACHE_DIR", tmp_path / "cache")
 
-    def fake_run(args, capture_output, text, timeout):
+    async def fake_exec(*args, **kwargs):
         assert args[0] == "slither"
         payload = {"results": {"detectors": []}}
-        return SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr="")
+        return FakeProcess(returncode=0, stdout=json.dumps(payload).encode())
 
-    monkeypatch.setattr(server.subprocess, "run", fake_run)
+    monkeypatch.setattr(server.asyncio, "create_subprocess_exec", fake_exec)
 
     result = await server.run_slither(str(contract))
     assert result.success
     assert result.findings == []
 
 
+@pytest.mark.asyncio
+async def test_run_slither_uses_audit_cache(monkeypatch, tmp_path):
+    contract = tmp_path / "Test.sol"
+    contract.write_text("pragma solidity ^0.8.0; contract Test {}")
+
+    monkeypatch.setattr(server, "command_exists", lambda name: name == "slither")
+    monkeypatch.setattr(server, "_AUDIT_CACHE_DIR", tmp_path / "cache")
+
+    audit_calls = []
+
+    async def fake_exec(*args, **kwargs):
+        if "--json" in args:
+            audit_calls.append(args)
+        payload = {"results": {"detectors": []}}
+        return FakeProcess(returncode=0, stdout=json.dumps(payload).encode())
+
+    monkeypatch.setattr(server.asyncio, "create_subprocess_exec", fake_exec)
+
+    first = await server.run_slither(str(contract))
+    second = await server.run_slither(str(contract))
+    assert first.success and second.success
+    assert len(audit_calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_run_slither_missing_file():
     result = await server.run_slither("/non/existent.sol")
@@ -60,6 +102,32 @@ async def test_pattern_analysis_detects_warning(tmp_path):
     assert any("reentrancy" in finding.lower() for finding in result.findings)
 
 
+@pytest.mark.asyncio
+async def test_pattern_analysis_literal_findings(tmp_path):
+    contract = tmp_path / "Legacy.sol"
+    contract.write_text(
+        """pragma solidity ^0.8.0;\ncontract Legacy {\n    function die() external {\n        selfdestruct(payable(tx.origin));\n    }\n}\n"""
+    )
+
+    result = await server.analyze_contract_patterns(str(contract))
+    assert result.success
+    assert any("selfdestruct" in finding for finding in result.findings)
+    assert any("tx.origin" in finding for finding in result.findings)
+
+
+@pytest.mark.asyncio
+async def test_pattern_analysis_ignores_comments(tmp_path):
+    contract = tmp_path / "Clean.sol"
+    contract.write_text(
+        """pragma solidity ^0.8.0;\n// this contract never calls selfdestruct\ncontract Clean {\n    string public note = "no delegatecall here";\n}\n"""
+    )
+
+    result = await server.analyze_contract_patterns(str(contract))
+    assert result.success
+    assert not any("selfdestruct" in finding for finding in result.findings)
+    assert not any("delegatecall" in finding for finding in result.findings)
+
+
 @pytest.mark.asyncio
 async def test_read_contract_returns_source(tmp_path):
     contract = tmp_path / "Read.sol"
@@ -74,7 +142,12 @@ async def test_read_contract_returns_source(tmp_path):
 async def test_check_tools_reports_availability(monkeypatch):
     states = {"slither": True, "aderyn": False}
     monkeypatch.setattr(server, "command_exists", lambda name: states.get(name, False))
-    monkeypatch.setattr(server, "_get_tool_version", lambda cmds: "1.2.3")
+    monkeypatch.setattr(server, "_CHECK_TOOLS_CACHE", None)
+    monkeypatch.setattr(server, "TOOLS_AVAILABLE", {})
+    async def fake_version(tool, cmds):
+        return "1.2.3"
+
+    monkeypatch.setattr(server, "_get_tool_version", fake_version)
 
     result = await server.check_tools()
     assert result.success
@@ -85,6 +158,27 @@ async def test_check_tools_reports_availability(monkeypatch):
     assert payload["toolDetails"]["slither"]["version"] == "1.2.3"
 
 
+@pytest.mark.asyncio
+async def test_check_tools_refresh_reprobes_availability(monkeypatch):
+    def fake_command_exists(name):
+        return True
+
+    fake_command_exists.cache_clear = lambda: None
+    monkeypatch.setattr(server, "command_exists", fake_command_exists)
+    monkeypatch.setattr(server, "_CHECK_TOOLS_CACHE", None)
+    monkeypatch.setattr(server, "TOOLS_AVAILABLE", {"slither": False, "aderyn": False})
+
+    async def fake_version(tool, cmds):
+        return "1.2.3"
+
+    monkeypatch.setattr(server, "_get_tool_version", fake_version)
+
+    result = await server.check_tools(refresh=True)
+    assert result.success
+    assert server.TOOLS_AVAILABLE == {"slither": True, "aderyn": True}
+    assert server._tool_available("slither")
+
+
 @pytest.mark.asyncio
 async def test_execute_tool_unknown():
     result = await server.execute_tool("unknown", {})
@@ -106,5 +200,19 @@ def test_tool_definitions_match_expected():
         "aderyn_audit",
         "pattern_analysis",
         "read_contract",
+        "audit_all",
         "check_tools",
-    }
\ No newline at end of file
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_all_audits_merges_results(monkeypatch, tmp_path):
+    contract = tmp_path / "Test.sol"
+    contract.write_text("pragma solidity ^0.8.0;\ncontract Test {\n    function f() external {\n        selfdestruct(payable(msg.sender));\n    }\n}\n")
+
+    monkeypatch.setattr(server, "command_exists", lambda _: False)
+
+    result = await server.run_all_audits(str(contract))
+    assert result.success
+    assert "=== pattern_analysis ===" in (result.output or "")
+    assert any("selfdestruct" in finding for finding in result.findings)
\ No newline at end of file